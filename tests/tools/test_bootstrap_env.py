@@ -0,0 +1,57 @@
+"""
+Unit-Tests für die requires-python-Auswertung in tools/bootstrap_env.py.
+
+Prüft insbesondere Angaben mit mehreren Klauseln, bei denen nur die
+untere Schranke (>=) die Mindestversion bestimmt.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from tools.bootstrap_env import _parse_requires_python
+
+
+class TestParseRequiresPython:
+    """Tests für _parse_requires_python."""
+
+    @pytest.mark.parametrize(
+        ("spec", "expected"),
+        [
+            (">=3.11", (3, 11)),
+            (">=3.11.2", (3, 11)),
+            (" >= 3.10", (3, 10)),
+        ],
+    )
+    def test_single_lower_bound(self, spec, expected):
+        """Eine einzelne >=-Klausel liefert Major und Minor."""
+        assert _parse_requires_python(spec) == expected
+
+    @pytest.mark.parametrize(
+        ("spec", "expected"),
+        [
+            (">=3.10, <4", (3, 10)),
+            ("<4.0,>=3.11", (3, 11)),
+            (">=3, <4.0", (3, 0)),
+            ("!=3.12.0, >=3.11, <4", (3, 11)),
+        ],
+    )
+    def test_multi_clause_uses_lower_bound_only(self, spec, expected):
+        """Bei mehreren Klauseln zählt nur die >=-Klausel, nicht spätere Versionen."""
+        assert _parse_requires_python(spec) == expected
+
+    @pytest.mark.parametrize(
+        ("spec", "expected"),
+        [
+            ("~=3.12", (3, 12)),
+            ("==3.11.*", (3, 11)),
+        ],
+    )
+    def test_without_lower_bound_uses_first_version(self, spec, expected):
+        """Ohne >= wird die erste Version X.Y verwendet."""
+        assert _parse_requires_python(spec) == expected
+
+    @pytest.mark.parametrize("spec", ["", "3", ">=", "any"])
+    def test_unparseable_returns_none(self, spec):
+        """Ohne erkennbare Version wird None geliefert."""
+        assert _parse_requires_python(spec) is None
@@ -59,14 +59,14 @@ Das Modul folgt dem Prinzip der funktionalen Dekomposition:
 - Error-Logging: Zentralisierte Fehlerprotokollierung
 - Progress-Tracking: ProgressBar-Klasse für visuelle Rückmeldung
 - Subprocess-Helpers: Sichere Behandlung von subprocess-Fehlern
-- Installation-Functions: Modulare Package-Installation
+- Installation-Functions: Package-Installation in einem gebündelten pip-Aufruf
 - Verification: Post-Installation Validierung
 - Testing: Automatische Test-Ausführung
 
-Threading:
-- Projekt-Installation und Tests laufen in Background-Threads
-- Ermöglicht parallele Progress-Anzeige
-- Synchronisation via threading.Event
+Subprozess-Streaming:
+- pip und pytest laufen als Subprozess (subprocess.Popen) im Hauptthread
+- stdout wird zeilenweise gelesen und treibt direkt die Progress-Anzeige
+- Im Speicher bleiben nur die letzten Ausgabezeilen (Zusammenfassung/Fehler-Log)
 
 Type Safety:
 - Explizite Type Hints mit | None Unions
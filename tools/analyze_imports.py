@@ -37,12 +37,18 @@ class ImportAnalyzer:
             'imports': [],
             'from_imports': {},
             'used_names': set(),
+            'uses_utils_threads': False,
         }
 
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
                 content = f.read()
-                tree = ast.parse(content)
+            # Deprecated-Check direkt am gelesenen Inhalt, vor dem Parsen
+            # (greift so auch bei Dateien mit Syntaxfehlern)
+            result['uses_utils_threads'] = (
+                'from ..utils.threads import' in content or 'from .threads import' in content
+            )
+            tree = ast.parse(content)
 
             # Sammle Imports
             for node in ast.walk(tree):
@@ -196,9 +202,7 @@ class ImportAnalyzer:
                     sync_importers['direct'].append(rel_path)
 
                 # Prüfe utils.threads imports (DEPRECATED)
-                with open(filepath, 'r') as f:
-                    content = f.read()
-                if 'from ..utils.threads import' in content or 'from .threads import' in content:
+                if result['uses_utils_threads']:
                     utils_threads_importers.append(rel_path)
             except:
                 pass
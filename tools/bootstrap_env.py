@@ -15,13 +15,16 @@ Siehe tools/__init__.py für vollständige Modul-Dokumentation.
 
 from __future__ import annotations
 
-import importlib.metadata as importlib_metadata
+import atexit
+import datetime
+import os
 import re
+import shutil
 import subprocess
 import sys
-import tomllib
+from collections import deque
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator, TextIO
 
 
 # --- CLI-Output helpers ----------------------------------------------------
@@ -45,19 +48,95 @@ def print_warning(text: str) -> None:
     print(f"   ⚠️  {text}")
 
 
+# Gemeinsamer Prefix für print_info() und print_info_lines()
+_INFO_PREFIX = "   ℹ️  "
+
+
 def print_info(text: str) -> None:
-    print(f"   ℹ️  {text}")
+    print(f"{_INFO_PREFIX}{text}")
 
 
 def print_fix(text: str) -> None:
     print(f"   🔧 {text}")
 
 
+def print_info_lines(lines: list[str]) -> None:
+    """Gibt mehrere Info-Zeilen mit einem einzigen write()/flush() aus."""
+    if not lines:
+        return
+    sys.stdout.write("".join(f"{_INFO_PREFIX}{line}\n" for line in lines))
+    sys.stdout.flush()
+
+
 # --- Error Logging & Subprocess Helpers -----------------------------------
 
+# Lesepuffer für gestreamte Subprozess-Ausgabe: ein read() holt bis zu 64 KiB
+# aus der Pipe, die Zeilen werden anschließend aus dem Puffer geliefert
+_PIPE_BUFFER_SIZE = 65536
+
 # Globales Flag um zu tracken ob dies der erste Fehler im aktuellen Setup ist
 _first_error_in_setup = True
 
+# Ab dem ersten Fehler offen gehaltenes Handle auf die Log-Datei
+_error_log: TextIO | None = None
+
+
+def _pip_env() -> dict[str, str]:
+    """Liefert die Umgebung für pip-Aufrufe im Setup.
+
+    Unterdrückt den Versions-Check gegen PyPI (eine zusätzliche Netzwerkanfrage
+    pro Aufruf) und interaktive Rückfragen, die den Setup-Lauf blockieren würden.
+
+    Returns:
+        Kopie von os.environ mit gesetzten PIP_*-Variablen
+    """
+    return {**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1", "PIP_NO_INPUT": "1"}
+
+
+def _stream_command(
+        cmd: list[str],
+        on_line: Callable[[str], None],
+        tail_lines: int,
+        **popen_kwargs: Any,
+) -> tuple[int, deque[str]]:
+    """Startet einen Subprozess und verarbeitet dessen stdout zeilenweise.
+
+    Jede Zeile wird sofort an ``on_line`` übergeben; im Speicher bleiben nur die
+    letzten ``tail_lines`` Zeilen, unabhängig vom Umfang der Ausgabe.
+
+    Args:
+        cmd: Befehl und Argumente
+        on_line: Callback pro Ausgabezeile (z.B. Progress-Bar aktualisieren)
+        tail_lines: Anzahl der Zeilen, die für Fehlermeldungen erhalten bleiben
+        **popen_kwargs: Weitere Argumente für subprocess.Popen (stderr, env, ...)
+
+    Returns:
+        Tupel (Exit-Code, letzte Ausgabezeilen)
+
+    Raises:
+        OSError: Wenn der Prozess nicht gestartet werden kann
+    """
+    tail: deque[str] = deque(maxlen=tail_lines)
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        text=True,
+        bufsize=_PIPE_BUFFER_SIZE,
+        **popen_kwargs,
+    )
+    assert proc.stdout is not None
+    try:
+        with proc.stdout:
+            for line in proc.stdout:
+                on_line(line)
+                tail.append(line)
+    except BaseException:
+        # Abbruch (Callback-Fehler, Ctrl+C): Kindprozess nicht verwaist zurücklassen
+        proc.kill()
+        proc.wait()
+        raise
+    return proc.wait(), tail
+
 
 def extract_subprocess_error_details(exc: subprocess.CalledProcessError) -> str:
     """Extrahiert Fehlerdetails aus einer CalledProcessError.
@@ -93,6 +172,13 @@ def get_error_message(exc: subprocess.CalledProcessError) -> str:
     return str(exc)
 
 
+# pytest-Abschlusszeile, z.B. "12 passed, 1 skipped in 0.42s"
+_PYTEST_SUMMARY_PATTERN = re.compile(r"\d+ passed(?:, \d+ \w+)* in [\d.]+s")
+
+# Anzahl der Zeichen am Ende der Ausgabe, in denen die Zusammenfassung gesucht wird
+_PYTEST_SUMMARY_WINDOW = 4096
+
+
 def _extract_test_summary(stdout: str) -> str | None:
     """Extrahiert die Test-Zusammenfassung aus pytest stdout.
 
@@ -102,11 +188,9 @@ def _extract_test_summary(stdout: str) -> str | None:
     Returns:
         Zusammenfassungs-Zeile oder None
     """
-    lines = stdout.strip().split("\n")
-    for line in reversed(lines):
-        if "passed" in line.lower():
-            return line.strip()
-    return None
+    # Die Zusammenfassung steht am Ende: nur die letzten Zeichen durchsuchen
+    matches = _PYTEST_SUMMARY_PATTERN.findall(stdout[-_PYTEST_SUMMARY_WINDOW:])
+    return matches[-1] if matches else None
 
 
 def _extract_test_failure_summary(stdout: str) -> list[str]:
@@ -143,26 +227,42 @@ def log_error_to_file(log_file: Path, section: str, error_info: str, details: st
         error_info: Kurze Fehlerbeschreibung
         details: Detaillierte Ausgabe (stdout/stderr)
     """
-    global _first_error_in_setup
+    global _first_error_in_setup, _error_log
+
+    # Beim ersten Fehler: Datei neu erstellen (überschreiben) und Header schreiben;
+    # das Handle bleibt danach offen, weitere Fehler werden nur noch angehängt
+    if _first_error_in_setup or _error_log is None:
+        close_error_log()
+        _error_log = log_file.open("w" if _first_error_in_setup else "a", encoding="utf-8")
+        if _first_error_in_setup:
+            _error_log.write("# Setup Error Log\n# Nur Fehler werden hier protokolliert\n\n")
+            _first_error_in_setup = False
+
+    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    separator = "=" * 70
+    entry = f"\n{separator}\n[{timestamp}] FEHLER: {section}\n{separator}\n{error_info}\n"
+    if details:
+        entry += f"\nDetails:\n{details}\n"
+    _error_log.write(entry)
+    # Sofort auf Platte: der Nutzer wird direkt im Anschluss auf setup.log verwiesen
+    _error_log.flush()
+
+
+@atexit.register
+def close_error_log() -> None:
+    """Schließt das offene Handle der Log-Datei (spätestens beim Prozessende)."""
+    global _error_log
+    if _error_log is not None:
+        _error_log.close()
+        _error_log = None
 
-    # Beim ersten Fehler: Datei neu erstellen (überschreiben)
-    if _first_error_in_setup:
-        log_file.write_text("# Setup Error Log\n# Nur Fehler werden hier protokolliert\n\n")
-        _first_error_in_setup = False
 
-    # Fehler anhängen (append)
-    with log_file.open("a", encoding="utf-8") as log:
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log.write(f"\n{'=' * 70}\n")
-        log.write(f"[{timestamp}] FEHLER: {section}\n")
-        log.write(f"{'=' * 70}\n")
-        log.write(f"{error_info}\n")
-        if details:
-            log.write(f"\nDetails:\n{details}\n")
+# --- Progress Bar ---------------------------------------------------------
 
 
-# --- Progress Bar ---------------------------------------------------------
+# Zwischenstände nur auf einem Terminal zeichnen; in CI/Logs (kein TTY) würde
+# jedes "\r"-Update als eigene Zeile erscheinen
+_INTERACTIVE = sys.stdout.isatty() and not os.environ.get("CI")
 
 
 class ProgressBar:
@@ -181,6 +281,7 @@ class ProgressBar:
         self.prefix = prefix
         self.current = 0
         self._last_line_length = 0
+        self._last_drawn: tuple[int, str] | None = None
 
     def update(self, current: int, status: str = "") -> None:
         """Aktualisiert den Progress-Bar.
@@ -190,6 +291,11 @@ class ProgressBar:
             status: Statustext (z.B. aktuelles Paket)
         """
         self.current = min(current, self.total)
+        if not _INTERACTIVE and self.current < self.total:
+            return  # Nicht-interaktiv: nur der Endstand wird ausgegeben
+        if self._last_drawn == (self.current, status):
+            return  # Unveränderte Anzeige nicht erneut zeichnen
+        self._last_drawn = (self.current, status)
         percent = int((self.current / self.total) * 100) if self.total > 0 else 0
         filled = int((self.current / self.total) * self.width) if self.total > 0 else 0
         bar = "█" * filled + "░" * (self.width - filled)
@@ -217,28 +323,173 @@ class ProgressBar:
 # --- Platform helpers ------------------------------------------------------
 
 
+# os.name ist eine Konstante des Interpreters (kein uname()-Aufruf wie platform.system())
+_IS_WINDOWS = os.name == "nt"
+
+
 def get_platform_info() -> dict[str, str]:
     """Ermittelt Betriebssystemdaten sowie Aktivierungshinweise für das Virtualenv."""
     import platform
 
-    system = platform.system()
-    venv_dir = Path(".venv")
-    if system == "Windows":
-        python_venv = str(venv_dir / "Scripts" / "python.exe")
+    # Reine String-Joins: die Pfade werden ohnehin nur als str an subprocess übergeben
+    if _IS_WINDOWS:
+        bin_dir = os.path.join(".venv", "Scripts")
+        python_venv = os.path.join(bin_dir, "python.exe")
+        pip_venv = os.path.join(bin_dir, "pip.exe")
         activate_cmd = ".venv\\Scripts\\activate"
     else:
-        python_venv = str(venv_dir / "bin" / "python")
+        bin_dir = os.path.join(".venv", "bin")
+        python_venv = os.path.join(bin_dir, "python")
+        pip_venv = os.path.join(bin_dir, "pip")
         activate_cmd = "source .venv/bin/activate"
 
     return {
-        "system": system,
+        "system": platform.system(),
         "python_venv": python_venv,
+        "pip_venv": pip_venv,
         "activate_cmd": activate_cmd,
     }
 
 
 # --- pyproject + requirements parsing -------------------------------------
 
+# Paketname gefolgt von (optionaler) Versionsspezifikation, z.B. "numpy>=2.3.5"
+_REQUIREMENT_PATTERN = re.compile(r"([A-Za-z0-9_.\-]+)\s*(.*)")
+
+
+# PEP 503: "-", "_" und "." sind in Paketnamen gleichwertig
+_NAME_SEPARATORS = re.compile(r"[-_.]+")
+
+
+def _canonicalize_name(name: str) -> str:
+    """Normalisiert einen Paketnamen nach PEP 503 (z.B. "PyQt5_sip" -> "pyqt5-sip")."""
+    return _NAME_SEPARATORS.sub("-", name).lower()
+
+
+def _iter_requirements(lines: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """Liefert (Name, Versionsspezifikation) für jede gültige Requirement-Zeile.
+
+    Leere Zeilen und Kommentare werden übersprungen. Gemeinsamer Parser für
+    requirements.txt und [project.optional-dependencies].dev.
+
+    Args:
+        lines: Rohzeilen (Datei-Handle oder Liste aus pyproject.toml)
+
+    Yields:
+        Tupel aus Paketname und Versionsspezifikation (ggf. leer)
+    """
+    match_requirement = _REQUIREMENT_PATTERN.match
+    for raw_line in lines:
+        line = raw_line.strip()
+        if not line or line.startswith("#"):
+            continue
+        match = match_requirement(line)
+        if match:
+            yield match.group(1), match.group(2)
+
+
+# Sidecar-Cache im venv: geparstes pyproject.toml, gültig solange die Datei unverändert ist
+_PYPROJECT_CACHE_FILE = os.path.join(".venv", ".bootstrap_cache.json")
+
+
+def _load_pyproject_data(pyproject_file: Path) -> dict[str, Any]:
+    """Lädt pyproject.toml, bei unveränderter Datei aus dem JSON-Cache im .venv.
+
+    Schlüssel des Caches sind mtime (ns) und Größe der Datei (ein stat()-Aufruf);
+    der TOML-Parser läuft damit nur, wenn pyproject.toml seit dem letzten Setup
+    geändert wurde. Die Größe fängt Änderungen innerhalb derselben mtime-Auflösung ab.
+    Existiert noch kein .venv (erster Durchlauf), wird nichts geschrieben; ein
+    ungültiger Cache wird gelöscht und aus der pyproject.toml neu aufgebaut.
+
+    Args:
+        pyproject_file: Pfad zur pyproject.toml
+
+    Returns:
+        Geparster Inhalt der pyproject.toml
+    """
+    import json
+
+    stat = pyproject_file.stat()
+    key = [stat.st_mtime_ns, stat.st_size]
+    cache_file = Path(_PYPROJECT_CACHE_FILE)
+    corrupt = False
+    try:
+        cache = json.loads(cache_file.read_bytes())
+    except OSError:
+        pass  # Kein Cache -> neu parsen
+    except ValueError:
+        corrupt = True
+    else:
+        cached = cache.get("pyproject") if isinstance(cache, dict) else None
+        if not isinstance(cached, dict):
+            corrupt = True
+        elif cache.get("key") == key:
+            return cached
+
+    if corrupt:
+        # Ungültiges JSON oder unerwartete Struktur -> Cache verwerfen und neu parsen
+        try:
+            cache_file.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    import tomllib  # Nur bei Cache-Miss benötigt
+
+    with pyproject_file.open("rb") as fh:
+        data = tomllib.load(fh)
+
+    if cache_file.parent.is_dir():
+        try:
+            cache_file.write_text(json.dumps({"key": key, "pyproject": data}), encoding="utf-8")
+        except (OSError, TypeError):
+            pass  # TypeError: TOML-Datumswerte sind nicht JSON-serialisierbar
+    return data
+
+
+def _parse_requires_python(requires_python: str) -> tuple[int, int] | None:
+    """Ermittelt die Mindestversion (Major, Minor) aus einer requires-python-Angabe.
+
+    Bevorzugt wird die untere Schranke ``>=X.Y``, auch wenn sie nicht an erster
+    Stelle steht (z.B. ``"<4.0,>=3.11"``); ausgewertet wird dann nur diese Klausel
+    bis zum nächsten Komma, fehlt die Minor-Version gilt ``X.0``. Ohne ``>=`` zählt
+    die erste Version ``X.Y``.
+
+    Args:
+        requires_python: Wert von [project].requires-python
+
+    Returns:
+        Tupel (major, minor) oder None, wenn keine Version erkennbar ist
+    """
+    # Zeichenweiser Scan statt Regex: erste Ziffernfolge "X.Y" im Suchbereich
+    text = requires_python
+    lower_bound = text.find(">=")
+    if lower_bound >= 0:
+        i = lower_bound + 2
+        end = text.find(",", i)
+        length = end if end >= 0 else len(text)
+    else:
+        i, length = 0, len(text)
+
+    while i < length:
+        while i < length and not "0" <= text[i] <= "9":
+            i += 1
+        if i >= length:
+            break
+        major = 0
+        while i < length and "0" <= text[i] <= "9":
+            major = major * 10 + ord(text[i]) - 48
+            i += 1
+        if i + 1 < length and text[i] == "." and "0" <= text[i + 1] <= "9":
+            i += 1
+            minor = 0
+            while i < length and "0" <= text[i] <= "9":
+                minor = minor * 10 + ord(text[i]) - 48
+                i += 1
+            return major, minor
+        if lower_bound >= 0:
+            return major, 0  # ">=3" ohne Minor-Version
+    return None
+
 
 def parse_pyproject_toml() -> dict[str, Any]:
     """Liest pyproject.toml und liefert Versionsanforderungen sowie Metadaten."""
@@ -249,14 +500,12 @@ def parse_pyproject_toml() -> dict[str, Any]:
         return {}
 
     try:
-        with pyproject_file.open("rb") as fh:
-            data = tomllib.load(fh)
+        data = _load_pyproject_data(pyproject_file)
         requires_python = data.get("project", {}).get("requires-python", ">=3.11")
         print_info(f"Python-Anforderung: {requires_python}")
-        match = re.search(r"(\d+)\.(\d+)", requires_python)
-        if match:
-            major = int(match.group(1))
-            minor = int(match.group(2))
+        version = _parse_requires_python(requires_python)
+        if version:
+            major, minor = version
             print_success(f"Erkannt: Python {major}.{minor}+\n")
             return {
                 "requires_python": requires_python,
@@ -271,26 +520,15 @@ def parse_pyproject_toml() -> dict[str, Any]:
 
 def read_dev_requirements_from_pyproject(pyproject_data: dict[str, Any]) -> dict[str, str]:
     """Extrahiert optionale Dev-Abhängigkeiten als Mapping von Name zu Versionsspezifikation."""
-    dev_reqs: dict[str, str] = {}
     opt = pyproject_data.get("project", {}).get("optional-dependencies", {})
     dev_entries = opt.get("dev", [])
     if not dev_entries:
-        return dev_reqs
+        return {}
 
     print("📖 Lese Dev-Dependencies aus pyproject.toml ([project.optional-dependencies].dev)...")
-    pattern = re.compile(r"^\s*([A-Za-z0-9_.\-]+)\s*(.*)$")
-    for entry in dev_entries:
-        line = entry.strip()
-        if not line or line.startswith("#"):
-            continue
-        match = pattern.match(line)
-        if not match:
-            continue
-        name = match.group(1)
-        version_spec = match.group(2).strip()
-        dev_reqs[name] = version_spec
-        print_info(f"{name}{version_spec}")
+    dev_reqs = dict(_iter_requirements(dev_entries))
 
+    print_info_lines([f"{name}{version_spec}" for name, version_spec in dev_reqs.items()])
     print_success(f"Dev-Dependencies gelesen: {len(dev_reqs)} Pakete\n")
     return dev_reqs
 
@@ -303,23 +541,14 @@ def parse_requirements() -> dict[str, str]:
         print_error("requirements.txt nicht gefunden!")
         return {}
 
-    requirements: dict[str, str] = {}
     try:
         with req_file.open("r", encoding="utf-8") as fh:
-            for raw_line in fh:
-                line = raw_line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                match = re.match(r"([A-Za-z0-9_.\-]+)(.*)", line)
-                if match:
-                    name = match.group(1)
-                    version_spec = match.group(2).strip()
-                    requirements[name] = version_spec
-                    print_info(f"{name}{version_spec}")
+            requirements = dict(_iter_requirements(fh))
     except Exception as exc:  # noqa: BLE001
         print_error(f"Fehler beim Parsen von requirements.txt: {exc}")
         return {}
 
+    print_info_lines([f"{name}{version_spec}" for name, version_spec in requirements.items()])
     print_success(f"Requirements gelesen: {len(requirements)} Pakete\n")
     return requirements
 
@@ -336,12 +565,12 @@ def check_python_version(pyproject_info: dict[str, Any] | None) -> bool:
         return True
 
     required = (int(pyproject_info.get("python_major", 3)), int(pyproject_info.get("python_minor", 11)))
-    current = (sys.version_info.major, sys.version_info.minor)
     print("📋 Prüfe Python-Version...")
     print_info(f"Python: {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}")
-    if current < required:
+    if sys.version_info[:2] < required:
         print_error(
-            f"Python {required[0]}.{required[1]}+ benötigt, aber {current[0]}.{current[1]} gefunden.",
+            f"Python {required[0]}.{required[1]}+ benötigt, "
+            f"aber {sys.version_info.major}.{sys.version_info.minor} gefunden.",
         )
         return False
 
@@ -351,39 +580,133 @@ def check_python_version(pyproject_info: dict[str, Any] | None) -> bool:
     return True
 
 
-def create_virtualenv() -> bool:
-    """Erstellt .venv, falls noch nicht vorhanden."""
-    venv_dir = Path(".venv")
-    if venv_dir.exists():
+def _locate_venv_executables(platform_info: dict[str, str]) -> bool:
+    """Sucht python/pip im .venv und übernimmt die tatsächlichen Pfade.
+
+    Durchsucht bin/ und Scripts/, damit auch abweichende venv-Layouts (z.B. von uv
+    oder Conda erzeugt) gefunden werden. Die gefundenen Pfade ersetzen die
+    Standardwerte aus get_platform_info() und zeigen garantiert auf existierende
+    Executables.
+
+    Args:
+        platform_info: Plattform-Informationen (wird in-place aktualisiert)
+
+    Returns:
+        True wenn ein Interpreter gefunden wurde, sonst False
+    """
+    search_path = os.pathsep.join((os.path.join(".venv", "bin"), os.path.join(".venv", "Scripts")))
+    python_venv = shutil.which("python", path=search_path)
+    if python_venv is None:
+        return False
+
+    platform_info["python_venv"] = python_venv
+    pip_venv = shutil.which("pip", path=search_path)
+    if pip_venv is not None:
+        platform_info["pip_venv"] = pip_venv
+    return True
+
+
+def create_virtualenv(platform_info: dict[str, str]) -> bool:
+    """Erstellt .venv, falls noch kein lauffähiger Interpreter darin existiert.
+
+    Geprüft wird der Interpreter selbst statt nur das Verzeichnis: ein leeres oder
+    halb angelegtes .venv (z.B. nach abgebrochenem Setup) wird sonst als gültig
+    übernommen und alle folgenden pip-Aufrufe scheitern erst beim Prozessstart.
+    """
+    if _locate_venv_executables(platform_info):
         print_success("Virtual Environment existiert bereits\n")
         return True
 
+    import venv
+
     print("📦 Erstelle Virtual Environment...")
     try:
-        subprocess.run([sys.executable, "-m", "venv", ".venv"], check=True)
-        print_success("Virtual Environment erstellt\n")
-        return True
-    except subprocess.CalledProcessError as exc:  # noqa: TRY003
+        # Im laufenden Prozess statt über "python -m venv" (spart einen Interpreter-Start);
+        # Symlinks auf den Basis-Interpreter wie beim venv-CLI, außer unter Windows.
+        # clear=True: Reste eines halb angelegten .venv (inkl. der Bootstrap-Marker für
+        # Requirements und Tests) dürfen das neu gebaute venv nicht als fertig ausweisen.
+        venv.EnvBuilder(symlinks=not _IS_WINDOWS, with_pip=True, clear=True).create(".venv")
+    except (subprocess.CalledProcessError, OSError) as exc:  # noqa: TRY003
         print_error(f"Fehler beim Erstellen des Virtual Environment: {exc}")
         return False
 
+    if not _locate_venv_executables(platform_info):
+        print_error("Virtual Environment erstellt, aber kein Python-Interpreter darin gefunden.")
+        return False
+
+    print_success("Virtual Environment erstellt\n")
+    return True
+
+
+# Mindestversionen der Build-Werkzeuge im venv; ältere Versionen werden aktualisiert
+# (pip >= 21.3 für Editable-Installs "-e ." über pyproject.toml nach PEP 660,
+# setuptools >= 66.1 laut build-system.requires)
+_BUILD_TOOL_MINIMUMS: dict[str, tuple[int, int]] = {
+    "pip": (21, 3),
+    "setuptools": (66, 1),
+    "wheel": (0, 0),
+}
+
+# Gibt "name version" (bzw. nur "name" wenn nicht installiert) pro Build-Werkzeug aus
+_BUILD_TOOL_PROBE = (
+    "import importlib.metadata as m\n"
+    "for n in ('pip', 'setuptools', 'wheel'):\n"
+    "    try: print(n, m.version(n))\n"
+    "    except m.PackageNotFoundError: print(n)\n"
+)
+
+
+def _outdated_build_tools(python_venv: str) -> list[str]:
+    """Ermittelt mit einem kurzen Interpreter-Aufruf, welche Build-Werkzeuge veraltet sind.
+
+    Args:
+        python_venv: Pfad zum Python-Interpreter im venv
+
+    Returns:
+        Namen der Pakete, die fehlen oder unter der Mindestversion liegen
+        (bei fehlgeschlagener Prüfung alle)
+    """
+    result = subprocess.run([python_venv, "-c", _BUILD_TOOL_PROBE], capture_output=True, text=True, check=False)
+    if result.returncode != 0:
+        return list(_BUILD_TOOL_MINIMUMS)
+
+    outdated: list[str] = []
+    for line in result.stdout.splitlines():
+        name, _, version = line.partition(" ")
+        if name not in _BUILD_TOOL_MINIMUMS:
+            continue
+        try:
+            current = tuple(int(part) for part in version.split(".")[:2])
+        except ValueError:
+            current = ()
+        if not version or current < _BUILD_TOOL_MINIMUMS[name]:
+            outdated.append(name)
+    return outdated
+
 
 def update_pip(platform_info: dict[str, str]) -> bool:
-    """Aktualisiert pip, setuptools und wheel innerhalb des Virtualenv."""
+    """Aktualisiert pip, setuptools und wheel innerhalb des Virtualenv (nur falls nötig)."""
     python_venv = platform_info["python_venv"]
     print("⬆️  Aktualisiere pip, setuptools und wheel...")
+    outdated = _outdated_build_tools(python_venv)
+    if not outdated:
+        print_success("pip, setuptools und wheel sind aktuell genug\n")
+        return True
+
+    specs: list[str] = []
+    for name in outdated:
+        major, minor = _BUILD_TOOL_MINIMUMS[name]
+        specs.append(f"{name}>={major}.{minor}")
+    # Bewusst "python -m pip": pip.exe kann sich unter Windows nicht selbst ersetzen.
+    # Ein gemeinsamer Aufruf spart einen kompletten Interpreter- und pip-Start.
     try:
         subprocess.run(
-            [python_venv, "-m", "pip", "install", "--upgrade", "pip", "--quiet"],
+            [python_venv, "-m", "pip", "install", "--upgrade", *specs, "--quiet"],
             check=True,
             capture_output=True,
+            env=_pip_env(),
         )
-        subprocess.run(
-            [python_venv, "-m", "pip", "install", "--upgrade", "setuptools>=66.1.0", "wheel", "--quiet"],
-            check=True,
-            capture_output=True,
-        )
-        print_success("pip, setuptools und wheel aktualisiert\n")
+        print_success(f"Aktualisiert: {', '.join(outdated)}\n")
         return True
     except subprocess.CalledProcessError as exc:  # noqa: TRY003
         print_error(f"Fehler beim Aktualisieren von pip/setuptools/wheel: {exc}")
@@ -391,17 +714,27 @@ def update_pip(platform_info: dict[str, str]) -> bool:
 
 
 def configure_pip_index(platform_info: dict[str, str]) -> None:
-    """Setzt den Standard-PyPI-Index für reproduzierbare Installationen."""
-    python_venv = platform_info["python_venv"]
+    """Setzt den Standard-PyPI-Index für reproduzierbare Installationen.
+
+    Schreibt die venv-eigene pip-Konfiguration (.venv/pip.conf bzw. .venv/pip.ini
+    unter Windows) direkt, statt dafür einen Interpreter mit ``pip config set``
+    zu starten. Die Einstellung gilt damit nur für das Projekt-venv.
+    """
+    import configparser
+
     print_fix("Konfiguriere pip Index (behebt typische PyPI-Fehler)...")
+    config_name = "pip.ini" if _IS_WINDOWS else "pip.conf"
+    config_file = Path(".venv") / config_name
     try:
-        subprocess.run(
-            [python_venv, "-m", "pip", "config", "set", "global.index-url", "https://pypi.org/simple"],
-            check=False,
-            capture_output=True,
-        )
+        parser = configparser.ConfigParser()
+        parser.read(config_file, encoding="utf-8")
+        if not parser.has_section("global"):
+            parser.add_section("global")
+        parser.set("global", "index-url", "https://pypi.org/simple")
+        with config_file.open("w", encoding="utf-8") as fh:
+            parser.write(fh)
         print_success("PyPI Index konfiguriert")
-    except Exception as exc:  # noqa: BLE001
+    except (OSError, configparser.Error) as exc:
         print_warning(f"Konnte pip Index nicht konfigurieren: {exc}")
     print()
 
@@ -432,204 +765,308 @@ def check_pyqt5_macos(platform_info: dict[str, str]) -> None:
 
 # --- Dependency installation ----------------------------------------------
 
+# Anzahl der letzten pip-Ausgabezeilen, die für das Fehler-Log im Speicher bleiben
+_PIP_OUTPUT_TAIL_LINES = 200
+
+# pip-Ausgabezeilen, die den Abschluss der Auflösung eines Pakets markieren
+_PIP_PROGRESS_PREFIXES = ("Collecting ", "Obtaining ", "Requirement already satisfied: ")
+
+
+def _pip_progress_status(line: str) -> str | None:
+    """Leitet aus einer pip-Ausgabezeile einen Statustext für den Progress-Bar ab.
+
+    Args:
+        line: Eine Zeile der pip-Ausgabe
+
+    Returns:
+        Statustext oder None, falls die Zeile keinen Fortschritt markiert
+    """
+    if not line.startswith(_PIP_PROGRESS_PREFIXES):
+        return None
+    parts = line.split(":", 1)[-1].split() if line.startswith("Requirement") else line.split()[1:]
+    return f"Verarbeite {parts[0]}..." if parts else "Verarbeite..."
+
+
+# pip-Fehlerzeilen für Requirements, die sich nicht auflösen lassen
+_PIP_UNRESOLVED_PATTERN = re.compile(
+    r"(?:No matching distribution found for|"
+    r"Could not find a version that satisfies the requirement) (\S+)"
+)
+
+
+def _unresolved_requirements(pip_output: str) -> list[str]:
+    """Ermittelt aus der pip-Fehlerausgabe die nicht auflösbaren Requirements.
+
+    Args:
+        pip_output: stderr (bzw. stdout) des fehlgeschlagenen pip-Laufs
+
+    Returns:
+        Liste der betroffenen Requirement-Specs in Reihenfolge ihres Auftretens
+    """
+    return list(dict.fromkeys(_PIP_UNRESOLVED_PATTERN.findall(pip_output)))
+
 
 def _install_requirements_batch(
-    python_venv: str,
+    pip_venv: str,
     requirements: dict[str, str],
     category_name: str,
     success_message: str
 ) -> bool:
-    """Hilfsfunktion: Installiert eine Gruppe von Requirements mit Progress-Bar.
+    """Hilfsfunktion: Installiert Requirements und das Projekt in einem pip-Aufruf.
+
+    Alle Pakete werden zusammen mit ``-e .`` an einen einzigen ``pip install``
+    übergeben, sodass pip nur einmal startet und der Resolver die gesamte Menge
+    in einem Durchlauf auflöst. Der Progress-Bar wird aus pip's Zeilenausgabe
+    (``Collecting ...`` / ``Requirement already satisfied: ...``) gespeist.
 
     Args:
-        python_venv: Pfad zum Python-Interpreter im venv
+        pip_venv: Pfad zum pip-Skript im venv
         requirements: Dictionary {package_name: version_spec}
-        category_name: Name der Kategorie für Logging (z.B. "Runtime-Dependency")
+        category_name: Name der Kategorie für Logging (z.B. "Dependency")
         success_message: Erfolgsmeldung nach Installation
 
     Returns:
         True bei Erfolg, False bei Fehler
     """
+    import locale
+    import tempfile
+
     log_file = Path("setup.log")
-    total = len(requirements)
+    specs = [f"{name}{version_spec}" for name, version_spec in requirements.items()]
+    # --prefer-binary: vorhandene Wheels statt sdist-Builds verwenden
+    cmd = [pip_venv, "install", *specs, "-e", ".", "--prefer-binary", "--progress-bar", "off"]
+    total = len(specs) + 1  # + Projekt (-e .)
     progress = ProgressBar(total, prefix="   ")
+    progress.update(0, "Löse Abhängigkeiten auf...")
+
+    processed = 0
+
+    def on_line(line: str) -> None:
+        nonlocal processed
+        status = _pip_progress_status(line)
+        if status is not None:
+            processed += 1
+            progress.update(min(processed, total - 1), status)
+
+    # stderr in Datei statt Pipe: kein Deadlock, während stdout zeilenweise gelesen wird.
+    # Binär gespoolt und wie stdout mit der Locale-Kodierung dekodiert (unter Windows
+    # z.B. cp1252); errors="replace", damit Umlaute den Fehlerpfad nicht abbrechen.
+    with tempfile.TemporaryFile("w+b") as stderr_file:
+        returncode, tail = _stream_command(
+            cmd, on_line, _PIP_OUTPUT_TAIL_LINES, stderr=stderr_file, env=_pip_env()
+        )
+        stderr_file.seek(0)
+        stderr = stderr_file.read().decode(locale.getpreferredencoding(False), errors="replace")
 
-    installed_count = 0
-    for idx, (name, version_spec) in enumerate(requirements.items(), start=1):
-        spec = f"{name}{version_spec}"
-        progress.update(idx - 1, f"Installiere {name}...")
-
-        try:
-            subprocess.run(
-                [python_venv, "-m", "pip", "install", spec, "--progress-bar", "off"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            installed_count += 1
+    if returncode != 0:
+        exc = subprocess.CalledProcessError(returncode, cmd, output="".join(tail), stderr=stderr)
+        progress.finish("❌ Fehler bei Installation")
+        print_error("Fehler bei der Installation der Dependencies:")
+        print(get_error_message(exc))
 
-        except subprocess.CalledProcessError as exc:
-            progress.finish(f"❌ Fehler bei {name}")
-            print_error(f"Fehler bei der Installation von {spec}:")
-            print(get_error_message(exc))
+        # Im Batch-Lauf die konkret fehlerhaften Pakete benennen
+        unresolved = _unresolved_requirements(stderr or exc.output)
+        for spec in unresolved:
+            print_error(f"Nicht auflösbar: {spec}")
 
-            log_error_to_file(
-                log_file,
-                f"{category_name} Installation: {spec}",
-                f"Fehler beim Installieren von {spec}",
-                extract_subprocess_error_details(exc)
-            )
+        log_error_to_file(
+            log_file,
+            f"{category_name} Installation: {' '.join(specs)} -e .",
+            f"Nicht auflösbare Requirements: {', '.join(unresolved)}" if unresolved
+            else "Fehler beim Installieren der Dependencies bzw. des Projekts",
+            extract_subprocess_error_details(exc)
+        )
 
-            print_info(f"Fehlerdetails in {log_file} gespeichert")
-            return False
+        print_info(f"Fehlerdetails in {log_file} gespeichert")
+        return False
 
-    progress.finish(f"✓ {installed_count}/{total} Pakete installiert")
+    progress.finish(f"✓ {len(specs)} Pakete + Projekt installiert")
     print_success(success_message)
     return True
 
 
-def install_runtime_requirements(platform_info: dict[str, str], requirements: dict[str, str]) -> bool:
-    """Installiert Laufzeitabhängigkeiten aus requirements.txt mit Progress-Bar."""
-    python_venv = platform_info["python_venv"]
-    print("📥 Installiere Runtime-Dependencies (aus requirements.txt)...\n")
+# Hash der zuletzt erfolgreich installierten Requirements (im venv; create_virtualenv
+# baut mit clear=True, ein neu erstelltes venv startet also immer ohne Marker)
+_REQUIREMENTS_MARKER_FILE = os.path.join(".venv", ".bootstrap_reqs.sha256")
 
-    if not requirements:
-        print_warning("Keine Requirements gefunden!")
-        return False
+# Requirements-Hash des letzten erfolgreichen Testlaufs (siehe _requirements_hash)
+_TESTS_OK_MARKER_FILE = os.path.join(".venv", ".bootstrap_tests_ok")
 
-    return _install_requirements_batch(
-        python_venv,
-        requirements,
-        "Runtime-Dependency",
-        "Alle Runtime-Dependencies installiert\n"
-    )
+# Prüft im venv-Interpreter, ob alle als Argumente übergebenen Distributionen installiert
+# sind, und gibt die fehlenden aus (Exit-Code 1 falls welche fehlen)
+_VENV_SYNC_PROBE = (
+    "import importlib.metadata as m, sys\n"
+    "missing = []\n"
+    "for n in sys.argv[1:]:\n"
+    "    try: m.distribution(n)\n"
+    "    except m.PackageNotFoundError: missing.append(n)\n"
+    "print(*missing)\n"
+    "sys.exit(1 if missing else 0)\n"
+)
 
 
-def install_dev_requirements(platform_info: dict[str, str], dev_requirements: dict[str, str]) -> bool:
-    """Installiert optionale Entwicklungsabhängigkeiten mit Progress-Bar."""
-    if not dev_requirements:
-        return True
+def _requirements_hash(requirements: dict[str, str], pyproject_data: dict[str, Any]) -> str:
+    """Bildet einen stabilen Hash über Requirements, Projekt-Metadaten und Python-Version.
 
-    python_venv = platform_info["python_venv"]
-    print("📥 Installiere Dev-Dependencies (pytest, black, flake8, ...)...\n")
+    Neben den Requirements fließen [build-system], [project] und [tool.setuptools]
+    ein, da ``pip install -e .`` von diesen Tabellen abhängt.
 
-    return _install_requirements_batch(
-        python_venv,
-        dev_requirements,
-        "Dev-Dependency",
-        "Alle Dev-Dependencies installiert\n"
-    )
+    Args:
+        requirements: Dictionary {package_name: version_spec}
+        pyproject_data: Geparster Inhalt der pyproject.toml
 
+    Returns:
+        Hex-Digest (SHA-256)
+    """
+    import hashlib
+    import json
+
+    payload = json.dumps(
+        {
+            "reqs": requirements,
+            "build-system": pyproject_data.get("build-system", {}),
+            "project": pyproject_data.get("project", {}),
+            "setuptools": pyproject_data.get("tool", {}).get("setuptools", {}),
+            "py": sys.version_info[:2],
+        },
+        sort_keys=True,
+        default=str,  # TOML-Datumswerte
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
-def install_project_editable(platform_info: dict[str, str]) -> bool:
-    """Registriert das Projekt mittels pip install -e . im Virtualenv (mit Progress-Simulation)."""
-    python_venv = platform_info["python_venv"]
-    print("📦 Installiere Projekt (Editable-Modus, -e .) im Virtual Environment...\n")
 
-    log_file = Path("setup.log")
+def _clear_bootstrap_markers() -> None:
+    """Entfernt Requirements- und Test-Marker, z.B. vor einer Neuinstallation."""
+    for marker in (_REQUIREMENTS_MARKER_FILE, _TESTS_OK_MARKER_FILE):
+        try:
+            Path(marker).unlink(missing_ok=True)
+        except OSError:
+            pass  # Marker sind nur eine Abkürzung für den nächsten Lauf
 
-    # Simuliere Progress während der Installation läuft
-    import threading
-    import time
 
-    progress = ProgressBar(100, prefix="   ")
-    install_done = threading.Event()
-    install_error: subprocess.CalledProcessError | None = None
+def _venv_in_sync(python_venv: str, names: Iterable[str]) -> bool:
+    """Prüft mit dem venv-Interpreter, ob alle Distributionen im venv installiert sind.
 
-    def run_install() -> None:
-        nonlocal install_error
-        try:
-            subprocess.run(
-                [python_venv, "-m", "pip", "install", "-e", ".", "--progress-bar", "off"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-        except subprocess.CalledProcessError as exc:
-            install_error = exc
-        finally:
-            install_done.set()
-
-    # Starte Installation in Thread
-    install_thread = threading.Thread(target=run_install)
-    install_thread.start()
-
-    # Simuliere Progress durch bekannte Phasen
-    phases = [
-        (20, "Prüfe Build-Backend..."),
-        (40, "Ermittle Requirements..."),
-        (60, "Erstelle Metadata..."),
-        (80, "Installiere Package..."),
-        (95, "Finalisiere Installation..."),
-    ]
-
-    for target, status in phases:
-        while not install_done.is_set():
-            for i in range(progress.current, min(target, 100)):
-                if install_done.is_set():
-                    break
-                progress.update(i, status)
-                time.sleep(0.05)
-            if progress.current >= target or install_done.is_set():
-                break
-
-    # Warte auf Abschluss
-    install_thread.join()
-
-    # Nur bei Fehler in Log schreiben
-    if install_error is not None:
-        progress.finish("❌ Fehler bei Installation")
-        print_error("Fehler bei der Installation des Projekts (-e .):")
-        print(get_error_message(install_error))
+    Args:
+        python_venv: Pfad zum Python-Interpreter im venv
+        names: Zu prüfende Distributionsnamen (Requirements und Projekt)
 
-        # Fehler in Log schreiben
-        log_error_to_file(
-            log_file,
-            "Projekt-Installation (Editable Mode): -e .",
-            "Fehler beim Installieren des Projekts",
-            extract_subprocess_error_details(install_error)
+    Returns:
+        True wenn alle Distributionen im venv gefunden wurden
+    """
+    try:
+        result = subprocess.run(
+            [python_venv, "-c", _VENV_SYNC_PROBE, *names],
+            capture_output=True,
+            text=True,
+            check=False,
         )
+    except OSError:
+        return False
+    if result.returncode != 0 and result.stdout.strip():
+        print_info(f"Im venv fehlen: {result.stdout.strip()} - installiere neu")
+    return result.returncode == 0
 
-        print_info(f"Fehlerdetails in {log_file} gespeichert")
+
+def install_requirements(
+        platform_info: dict[str, str],
+        runtime_requirements: dict[str, str],
+        dev_requirements: dict[str, str],
+        pyproject_data: dict[str, Any],
+) -> bool:
+    """Installiert Runtime-, Dev-Dependencies und das Projekt (-e .) in einem pip-Lauf."""
+    if not runtime_requirements:
+        print_warning("Keine Requirements gefunden!")
+        return False
+
+    print("📥 Installiere Dependencies (requirements.txt + Dev) und Projekt (Editable-Modus, -e .)...\n")
+    pip_venv = platform_info["pip_venv"]
+    requirements = {**runtime_requirements, **dev_requirements}
+
+    # Unveränderte Requirements seit dem letzten erfolgreichen Lauf -> kein pip-Aufruf,
+    # sofern der venv-Interpreter selbst alle Pakete (inkl. Projekt) noch findet
+    marker_file = Path(_REQUIREMENTS_MARKER_FILE)
+    req_hash = _requirements_hash(requirements, pyproject_data)
+    try:
+        marker_matches = marker_file.read_text(encoding="utf-8").strip() == req_hash
+    except OSError:
+        marker_matches = False  # Kein Marker -> regulär installieren
+    project_name = pyproject_data.get("project", {}).get("name")
+    dist_names = [*requirements, *([project_name] if project_name else [])]
+    if marker_matches and _venv_in_sync(platform_info["python_venv"], dist_names):
+        print_success("Dependencies unverändert - bestehendes venv wird verwendet\n")
+        return True
+
+    # Neuinstallation: auch der Test-Marker gilt nicht mehr für dieses venv
+    _clear_bootstrap_markers()
+    if not _install_requirements_batch(
+        pip_venv,
+        requirements,
+        "Dependency",
+        "Alle Dependencies installiert, Projekt als Editable registriert (core.* ist als Paket verfügbar)\n"
+    ):
         return False
 
-    progress.finish("✓ Projekt installiert")
-    print_success("Projekt als Editable installiert (core.* ist als Paket verfügbar)\n")
+    try:
+        marker_file.write_text(req_hash, encoding="utf-8")
+    except OSError:
+        pass  # Marker ist nur eine Abkürzung für den nächsten Lauf
     return True
 
 
 # --- Verification ----------------------------------------------------------
 
+def _installed_distributions() -> dict[str, str]:
+    """Ermittelt alle installierten Distributionen in einem einzigen Durchlauf.
+
+    Returns:
+        Mapping {normalisierter Paketname: installierte Version}
+    """
+    import importlib.metadata as importlib_metadata
+
+    installed: dict[str, str] = {}
+    for dist in importlib_metadata.distributions():
+        name = dist.metadata["Name"]
+        if name:
+            installed.setdefault(_canonicalize_name(name), dist.version)
+    return installed
+
 
 def verify_installation(
         runtime_requirements: dict[str, str],
         dev_requirements: dict[str, str],
 ) -> bool:
     """Überprüft installierte Pakete via importlib.metadata und ergänzt fehlende Komponenten."""
-    failed: list[tuple[str, str, str]] = []
+    import importlib.metadata as importlib_metadata
+
+    failed: list[str] = []
     log_file = Path("setup.log")
+    # Ein Sweep über sys.path statt eines eigenen Metadaten-Scans pro Paket
+    installed = _installed_distributions()
 
     def check_and_fix(scope: str, name: str, version_spec: str) -> None:
         display = f"{name}{version_spec}"
-        try:
-            installed_version = importlib_metadata.version(name)
+        key = _canonicalize_name(name)
+        installed_version = installed.get(key)
+        if installed_version is not None:
             print_success(f"   ✅ [{scope}] {display} (installiert: {installed_version})")
             return
-        except importlib_metadata.PackageNotFoundError:
-            print_warning(f"   ⚠️  [{scope}] {display} - nicht gefunden, versuche Installation...")
+        print_warning(f"   ⚠️  [{scope}] {display} - nicht gefunden, versuche Installation...")
 
         try:
-            subprocess.run([sys.executable, "-m", "pip", "install", f"{name}{version_spec}"], check=True)
-            installed_version = importlib_metadata.version(name)
-            print_success(f"   ✅ [{scope}] {display} (nach Installation: {installed_version})")
+            subprocess.run([sys.executable, "-m", "pip", "install", display], check=True, env=_pip_env())
+            installed.update(_installed_distributions())
+            if key not in installed:
+                raise importlib_metadata.PackageNotFoundError(name)
+            print_success(f"   ✅ [{scope}] {display} (nach Installation: {installed[key]})")
         except (subprocess.CalledProcessError, importlib_metadata.PackageNotFoundError) as exc:
             print_error(f"   ❌ [{scope}] {display} - Installation fehlgeschlagen: {exc}")
-            failed.append((scope, name, version_spec))
+            failed.append(f"[{scope}] {display}")
 
             # Fehler in Log schreiben
             log_error_to_file(
                 log_file,
-                f"Verifikation: {scope} - {name}{version_spec}",
+                f"Verifikation: {scope} - {display}",
                 f"Paket konnte nicht installiert/verifiziert werden",
                 str(exc)
             )
@@ -646,8 +1083,8 @@ def verify_installation(
     if failed:
         print("\n")
         print_error("   ❌ Folgende Pakete konnten nicht verifiziert werden:")
-        for scope, name, spec in failed:
-            print_error(f"      - [{scope}] {name}{spec}")
+        for entry in failed:
+            print_error(f"      - {entry}")
         print_info(f"Details siehe {log_file}")
         return False
     print()
@@ -657,23 +1094,39 @@ def verify_installation(
 # --- Final instructions ----------------------------------------------------
 
 
+# Abschlusstext nach erfolgreichem Setup; {activate_cmd} ist plattformabhängig
+_NEXT_STEPS_TEMPLATE = """\
+📍 Nächste Schritte:
+
+1️⃣  Aktiviere das Virtual Environment:
+    {activate_cmd}
+
+2️⃣  Starte die Demo (Simulation mit Demo-Autopilot):
+    python -m core.simulation.ufo_main
+
+3️⃣  Öffne die Autopilot-Aufgabe:
+    src/task/autopilot/autopilot.py
+
+    Implementiere die 3 Aufgaben:
+
+    - takeoff()  - Startphase
+    - cruise()   - Reiseflug
+    - landing()  - Landephase
+
+4️⃣  Setze USE_DEMO = False in der Klasse Autopilot (Attribut USE_DEMO)
+
+5️⃣  Starte die Demo erneut und teste deinen Autopiloten!
+
+Guten Flug! 🚀
+
+"""
+
+
 def print_next_steps(platform_info: dict[str, str]) -> None:
     """Zeigt empfohlene Schritte nach erfolgreichem Bootstrap an."""
     print_header("🎉 Setup erfolgreich abgeschlossen!")
-    print("📍 Nächste Schritte:\n")
-    print("1️⃣  Aktiviere das Virtual Environment:")
-    print(f"    {platform_info['activate_cmd']}\n")
-    print("2️⃣  Starte die Demo (Simulation mit Demo-Autopilot):")
-    print("    python -m core.simulation.ufo_main\n")
-    print("3️⃣  Öffne die Autopilot-Aufgabe:")
-    print("    src/task/autopilot/autopilot.py\n")
-    print("    Implementiere die 3 Aufgaben:\n")
-    print("    - takeoff()  - Startphase")
-    print("    - cruise()   - Reiseflug")
-    print("    - landing()  - Landephase\n")
-    print("4️⃣  Setze USE_DEMO = False in der Klasse Autopilot (Attribut USE_DEMO)\n")
-    print("5️⃣  Starte die Demo erneut und teste deinen Autopiloten!\n")
-    print("Guten Flug! 🚀\n")
+    sys.stdout.write(_NEXT_STEPS_TEMPLATE.format(activate_cmd=platform_info["activate_cmd"]))
+    sys.stdout.flush()
 
 
 def print_troubleshooting() -> None:
@@ -688,6 +1141,55 @@ def print_troubleshooting() -> None:
 
 # --- Test execution --------------------------------------------------------
 
+# Anzahl der letzten pytest-Zeilen, die für die Zusammenfassung im Speicher bleiben
+_TEST_OUTPUT_TAIL_LINES = 64
+
+# Verbose-Zeile seriell: "tests/...::TestX::test_name PASSED   [ 42%]"
+# bzw. mit xdist:       "[gw0] [ 42%] PASSED tests/...::TestX::test_name"
+_PYTEST_TEST_LINE = re.compile(
+    r"(?:\[gw\d+\]\s+\[\s*(?P<xdist_percent>\d+)%\]\s+\w+\s+)?"
+    r"tests/\S*::(?P<name>[^\s:]+)(?:.*\[\s*(?P<percent>\d+)%\])?"
+)
+
+# Liefert pytest-Version und ob pytest-xdist installiert ist (ein Interpreter-Start)
+_PYTEST_PROBE = (
+    "import importlib.util, pytest\n"
+    "print(pytest.__version__)\n"
+    "print(importlib.util.find_spec('xdist') is not None)\n"
+)
+
+
+def _tests_passed_for(req_hash: str) -> bool:
+    """Prüft, ob die Tests für diesen Requirements-Stand bereits erfolgreich liefen.
+
+    Args:
+        req_hash: Hash der aktuell installierten Requirements
+
+    Returns:
+        True wenn der Marker existiert und zum Hash passt
+    """
+    try:
+        return Path(_TESTS_OK_MARKER_FILE).read_text(encoding="utf-8").strip() == req_hash
+    except OSError:
+        return False
+
+
+def _record_test_result(req_hash: str, success: bool) -> None:
+    """Schreibt (bzw. entfernt bei Fehlschlag) den Marker für erfolgreiche Tests.
+
+    Args:
+        req_hash: Hash der aktuell installierten Requirements
+        success: Ergebnis des Testlaufs
+    """
+    marker_file = Path(_TESTS_OK_MARKER_FILE)
+    try:
+        if success:
+            marker_file.write_text(req_hash, encoding="utf-8")
+        else:
+            marker_file.unlink(missing_ok=True)
+    except OSError:
+        pass  # Marker ist nur eine Abkürzung für den nächsten Lauf
+
 
 def run_tests(platform_info: dict[str, str]) -> bool:
     """Führt pytest aus um Installation zu validieren (mit Progress-Bar).
@@ -701,84 +1203,85 @@ def run_tests(platform_info: dict[str, str]) -> bool:
     python_venv = platform_info["python_venv"]
     print_header("🧪 Führe Tests aus (Validierung der Installation)")
 
-    # Prüfe ob pytest verfügbar ist
+    # Prüfe ob pytest (und optional pytest-xdist) verfügbar ist
     try:
         result = subprocess.run(
-            [python_venv, "-m", "pytest", "--version"],
+            [python_venv, "-c", _PYTEST_PROBE],
             capture_output=True,
             text=True,
             check=True,
         )
-        print_info(f"pytest Version: {result.stdout.strip()}\n")
     except subprocess.CalledProcessError:
         print_error("pytest nicht gefunden - überspringe Tests")
         return False
+    # Nur die letzten beiden Zeilen auswerten: Warnungen oder Banner (z.B. aus
+    # sitecustomize) können vor der eigentlichen Probe-Ausgabe auf stdout landen
+    probe_lines = result.stdout.splitlines()[-2:]
+    if len(probe_lines) == 2 and probe_lines[1] in ("True", "False"):
+        pytest_version, has_xdist = probe_lines
+        print_info(f"pytest Version: pytest {pytest_version}\n")
+    else:
+        has_xdist = "False"  # Unerwartete Ausgabe -> sicherer Lauf ohne -n auto
+        print_warning("pytest-Version nicht ermittelbar - Tests laufen ohne pytest-xdist\n")
+
+    # Reiner Validierungslauf: ohne Header und ohne .pytest_cache-Schreibzugriffe
+    cmd = [python_venv, "-m", "pytest", "-v", "--tb=short", "-q", "--no-header", "-p", "no:cacheprovider"]
+    if has_xdist == "True":
+        # loadfile: Tests einer Datei laufen im selben Worker (Modul-Fixtures nur einmal)
+        cmd += ["-n", "auto", "--dist", "loadfile"]
+        print_info("pytest-xdist gefunden - Tests laufen parallel auf allen CPU-Kernen\n")
 
-    # Führe Tests im Hintergrund aus und zeige Progress
     print("Starte Tests...\n")
 
-    import threading
-    import time
+    import tempfile
 
-    tests_done = threading.Event()
-    test_result: subprocess.CompletedProcess[str] | None = None
-    test_error: Exception | None = None
+    log_file = Path("setup.log")
+    progress = ProgressBar(100, prefix="   ")
+    progress.update(0, "Führe Tests aus...")
+
+    # Nur das Ende der Ausgabe bleibt im Speicher (für die Zusammenfassung); die
+    # vollständige Ausgabe wird auf Platte gespoolt und nur im Fehlerfall gelesen.
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as spool:
+        # Attribut-Lookups einmal vor der Schleife statt pro Ausgabezeile
+        write = spool.write
+        match_test_line = _PYTEST_TEST_LINE.match
+        update = progress.update
+
+        def on_line(line: str) -> None:
+            write(line)
+            match = match_test_line(line)
+            if match:
+                percent = match["xdist_percent"] or match["percent"]
+                update(min(int(percent), 99) if percent else progress.current, match["name"])
 
-    def run_pytest() -> None:
-        nonlocal test_result, test_error
         try:
-            test_result = subprocess.run(
-                [python_venv, "-m", "pytest", "-v", "--tb=short", "-q"],
-                capture_output=True,
-                text=True,
-                check=False,
+            returncode, tail = _stream_command(
+                cmd, on_line, _TEST_OUTPUT_TAIL_LINES, stderr=subprocess.STDOUT
             )
-        except Exception as exc:
-            test_error = exc
-        finally:
-            tests_done.set()
-
-    # Starte Tests in Thread
-    test_thread = threading.Thread(target=run_pytest)
-    test_thread.start()
+        except OSError as exc:
+            progress.finish("❌ Fehler bei Test-Ausführung")
+            print_error(f"Fehler beim Ausführen der Tests: {exc}")
 
-    # Simuliere Progress während Tests laufen
-    progress = ProgressBar(100, prefix="   ")
-    elapsed = 0
-    while not tests_done.is_set():
-        if elapsed < 90:
-            elapsed = min(90, elapsed + 2)
-        progress.update(elapsed, "Führe Tests aus...")
-        time.sleep(0.1)
-
-    # Warte auf Abschluss
-    test_thread.join()
-
-    log_file = Path("setup.log")
-
-    # Error Handling
-    if test_error is not None:
-        progress.finish("❌ Fehler bei Test-Ausführung")
-        print_error(f"Fehler beim Ausführen der Tests: {test_error}")
-
-        log_error_to_file(
-            log_file,
-            "Test-Ausführung",
-            "Exception beim Ausführen von pytest",
-            str(test_error)
-        )
-        return False
+            log_error_to_file(
+                log_file,
+                "Test-Ausführung",
+                "Exception beim Ausführen von pytest",
+                str(exc)
+            )
+            return False
 
-    if test_result is None:
-        progress.finish("❌ Keine Test-Ergebnisse")
-        return False
+        output = "".join(tail)
+        full_output = ""
+        if returncode != 0:
+            spool.seek(0)
+            full_output = spool.read()
 
     progress.finish("✓ Tests abgeschlossen")
     print()
 
     # Analysiere Ergebnis
-    if test_result.returncode == 0:
-        summary_line = _extract_test_summary(test_result.stdout)
+    if returncode == 0:
+        summary_line = _extract_test_summary(output)
         if summary_line:
             print_success(f"Alle Tests erfolgreich: {summary_line}")
         else:
@@ -787,9 +1290,9 @@ def run_tests(platform_info: dict[str, str]) -> bool:
         return True
 
     # Tests fehlgeschlagen
-    print_warning(f"Einige Tests sind fehlgeschlagen (Exit-Code: {test_result.returncode})")
+    print_warning(f"Einige Tests sind fehlgeschlagen (Exit-Code: {returncode})")
 
-    summary_lines = _extract_test_failure_summary(test_result.stdout)
+    summary_lines = _extract_test_failure_summary(output)
     if summary_lines:
         print("\n📊 Test-Zusammenfassung:")
         for line in summary_lines[-5:]:
@@ -801,8 +1304,8 @@ def run_tests(platform_info: dict[str, str]) -> bool:
     log_error_to_file(
         log_file,
         "Test-Ausführung",
-        f"Tests fehlgeschlagen (Exit-Code: {test_result.returncode})",
-        test_result.stdout
+        f"Tests fehlgeschlagen (Exit-Code: {returncode})",
+        full_output
     )
 
     print()
@@ -821,6 +1324,8 @@ def main() -> int:
 
     Unterstützt folgende Kommandozeilen-Argumente:
         --skip-tests: Überspringt die Test-Ausführung nach Installation
+        --force-tests: Führt die Tests auch bei unveränderten, bereits validierten
+            Requirements aus
 
     Hinweis: setup.log wird nur bei Fehlern erstellt/beschrieben.
     Bei jedem Setup-Durchlauf wird eine vorhandene setup.log überschrieben.
@@ -828,9 +1333,11 @@ def main() -> int:
     # Setze Error-Logging-Flag zurück für diesen Setup-Durchlauf
     global _first_error_in_setup
     _first_error_in_setup = True
+    close_error_log()
 
     # Parse einfache CLI-Args
     skip_tests = "--skip-tests" in sys.argv
+    force_tests = "--force-tests" in sys.argv
 
     print_header("🛸 UFO-Simulation Schulung - Setup")
     platform_info = get_platform_info()
@@ -846,7 +1353,7 @@ def main() -> int:
 
     if not check_python_version(pyproject_info):
         return 1
-    if not create_virtualenv():
+    if not create_virtualenv(platform_info):
         print_troubleshooting()
         return 1
     if not update_pip(platform_info):
@@ -856,17 +1363,8 @@ def main() -> int:
     configure_pip_index(platform_info)
     check_pyqt5_macos(platform_info)
 
-    # Übergebe requirements dict an install-Funktion
-    if not install_runtime_requirements(platform_info, runtime_requirements):
-        print_troubleshooting()
-        return 1
-
     dev_requirements = read_dev_requirements_from_pyproject(pyproject_raw)
-    if not install_dev_requirements(platform_info, dev_requirements):
-        print_troubleshooting()
-        return 1
-
-    if not install_project_editable(platform_info):
+    if not install_requirements(platform_info, runtime_requirements, dev_requirements, pyproject_raw):
         print_troubleshooting()
         return 1
 
@@ -875,13 +1373,17 @@ def main() -> int:
         return 1
 
     # Tests ausführen (falls nicht übersprungen)
-    if not skip_tests:
+    req_hash = _requirements_hash({**runtime_requirements, **dev_requirements}, pyproject_raw)
+    if skip_tests:
+        print_info("Tests übersprungen (--skip-tests Flag gesetzt)\n")
+    elif not force_tests and _tests_passed_for(req_hash):
+        print_info("Tests übersprungen (Installation unverändert und bereits validiert, --force-tests erzwingt Lauf)\n")
+    else:
         test_success = run_tests(platform_info)
+        _record_test_result(req_hash, test_success)
         if not test_success:
             print_warning("Setup abgeschlossen, aber Tests sind fehlgeschlagen.")
             print_info("Du kannst das Projekt trotzdem verwenden, aber es könnten Probleme auftreten.\n")
-    else:
-        print_info("Tests übersprungen (--skip-tests Flag gesetzt)\n")
 
     print_next_steps(platform_info)
     return 0